@@ -242,21 +242,17 @@ class RedfishAnsibleModule(AnsibleModule):
             "ca_path": {"type": "path"},
             "timeout": {"type": "int", "default": 30},
         }
+        # Work on copies so that module level spec constants are never modified.
+        argument_spec = dict(argument_spec)
         argument_spec.update(redfish_argument_spec)
 
         auth_mutually_exclusive = [("username", "x_auth_token"), ("password", "x_auth_token")]
         auth_required_one_of = [("username", "x_auth_token")]
         auth_required_together = [("username", "password")]
 
-        if mutually_exclusive is None:
-            mutually_exclusive = []
-        mutually_exclusive.extend(auth_mutually_exclusive)
-        if required_together is None:
-            required_together = []
-        required_together.extend(auth_required_together)
-        if required_one_of is None:
-            required_one_of = []
-        required_one_of.extend(auth_required_one_of)
+        mutually_exclusive = list(mutually_exclusive or []) + auth_mutually_exclusive
+        required_together = list(required_together or []) + auth_required_together
+        required_one_of = list(required_one_of or []) + auth_required_one_of
         if required_by is None:
             required_by = {}
 
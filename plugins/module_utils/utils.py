@@ -265,9 +265,10 @@ def apply_diff_key(src, dest, klist):
     return diff_cnt
 
 
-def wait_for_job_completion(redfish_obj, uri, job_wait=True, wait_timeout=120, sleep_time=10):
+def wait_for_job_completion(redfish_obj, uri, job_wait=True, wait_timeout=120, sleep_time=30):
+    """Polls the job, starting at one second and growing the interval by half up to sleep_time."""
     max_sleep_time = wait_timeout
-    sleep_interval = sleep_time
+    sleep_interval = min(1, sleep_time)
     if job_wait:
         while max_sleep_time:
             if max_sleep_time > sleep_interval:
@@ -277,9 +278,13 @@ def wait_for_job_completion(redfish_obj, uri, job_wait=True, wait_timeout=120, s
                 max_sleep_time = 0
             time.sleep(sleep_interval)
             job_resp = redfish_obj.invoke_request("GET", uri)
-            if job_resp.json_data.get("PercentComplete") == 100:
+            job_data = job_resp.json_data
+            if job_data.get("PercentComplete") == 100:
                 time.sleep(10)
                 return job_resp, ""
+            if job_data.get("JobState") == "Failed":
+                return job_resp, ""
+            sleep_interval = min(sleep_interval * 1.5, sleep_time)
     else:
         job_resp = redfish_obj.invoke_request("GET", uri)
         time.sleep(10)
@@ -178,6 +178,8 @@ options:
       - Provides the option if the module has to wait for the job to be completed.
       - This is applicable for I(attributes) when I(apply_time) is C(Immediate)
        and when I(command) is C(SecureErase).
+      - When I(job_wait) is C(false), the module returns as soon as the job is submitted with the job
+        details in I(task). Use M(dellemc.openmanage.idrac_lifecycle_controller_job_status_info) to track the job.
     type: bool
     default: false
   job_wait_timeout:
@@ -542,6 +544,7 @@ error_info:
 
 
 import json
+from collections import Counter
 from ansible.module_utils.compat.version import LooseVersion
 from ansible_collections.dellemc.openmanage.plugins.module_utils.redfish import Redfish, RedfishAnsibleModule
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import wait_for_job_completion, strip_substr_dict, \
@@ -553,15 +556,22 @@ from ansible.module_utils.urls import ConnectionError, SSLValidationError
 SYSTEMS_URI = "/redfish/v1/Systems/"
 SYSTEM_ID = "System.Embedded.1"
 MANAGER_ID = "iDRAC.Embedded.1"
-RAID_ACTION_URI = "/redfish/v1/Systems/{system_id}/Oem/Dell/DellRaidService/Actions/DellRaidService.{action}"
+RAID_ACTION_URI = "/redfish/v1/Systems/" + SYSTEM_ID + "/Oem/Dell/DellRaidService/Actions/DellRaidService.{action}"
 CONTROLLER_URI = "/redfish/v1/Dell/Systems/{system_id}/Storage/DellController/{controller_id}"
 VOLUME_URI = "/redfish/v1/Systems/{system_id}/Storage/{controller_id}/Volumes"
+VOLUME_ID_URI = VOLUME_URI + "/{volume_id}"
+VOLUME_DRIVES_URI = VOLUME_ID_URI + "?$expand=*($levels=1)"
 PD_URI = "/redfish/v1/Systems/System.Embedded.1/Storage/{controller_id}/Drives/{drive_id}"
+EXPAND_MEMBERS_QUERY = "?$expand=.($levels=1)"
+STORAGE_DRIVES_URI = "/redfish/v1/Systems/{system_id}/Storage/{controller_id}" + EXPAND_MEMBERS_QUERY
+HOT_SPARE_TYPE_URI = PD_URI + "?$select=HotspareType"
 JOB_URI_OEM = "/redfish/v1/Managers/iDRAC.Embedded.1/Oem/Dell/Jobs/{job_id}"
 CONTROLLERS_URI = "/redfish/v1/Systems/{system_id}/Storage/{controller_id}/Controllers/{controller_id}"
 MANAGER_URI = "/redfish/v1/Managers/iDRAC.Embedded.1"
 SETTINGS_URI = "/redfish/v1/Systems/{system_id}/Storage/{controller_id}/Controllers/{controller_id}/Settings"
 OCE_MIN_PD_RAID_MAPPING = {'RAID0': 1, 'RAID5': 1, 'RAID6': 1, 'RAID10': 2}
+RAID_STATUS_CONVERSION = {"ConvertToRAID": ("Ready", "NonRAID"), "ConvertToNonRAID": ("NonRAID", "Ready")}
+HOT_SPARE_NO_CHANGES = {("AssignSpare", "Dedicated"), ("AssignSpare", "Global"), ("UnassignSpare", "None")}
 ODATA_ID = "@odata.id"
 
 JOB_SUBMISSION = "Successfully submitted the job that performs the '{0}' operation."
@@ -592,6 +602,52 @@ CONTROLLER_ID_REQUIRED = "controller_id is required to perform this operation."
 JOB_COMPLETION_ATTRIBUTES = "Successfully applied the controller attributes."
 JOB_SUBMISSION_ATTRIBUTES = "Successfully submitted the job that configures the controller attributes."
 ERR_MSG = "Unable to configure the controller attribute(s) settings."
+ALWAYS_CHANGED_COMMANDS = ["ReKey", "BlinkTarget", "UnBlinkTarget"]
+
+ARGUMENT_SPEC = {
+    "attributes": {"type": 'dict'},
+    "command": {"required": False,
+                "choices": ["ResetConfig", "AssignSpare", "SetControllerKey", "RemoveControllerKey",
+                            "ReKey", "UnassignSpare", "EnableControllerEncryption", "BlinkTarget",
+                            "UnBlinkTarget", "ConvertToRAID", "ConvertToNonRAID", "ChangePDStateToOnline",
+                            "ChangePDStateToOffline", "LockVirtualDisk", "OnlineCapacityExpansion", "SecureErase"]},
+    "controller_id": {"required": False, "type": "str"},
+    "volume_id": {"required": False, "type": "list", "elements": "str"},
+    "target": {"required": False, "type": "list", "elements": "str", "aliases": ["drive_id"]},
+    "key": {"required": False, "type": "str", "no_log": True},
+    "key_id": {"required": False, "type": "str"},
+    "old_key": {"required": False, "type": "str", "no_log": True},
+    "mode": {"required": False, "choices": ["LKM", "SEKM"], "default": "LKM"},
+    "apply_time": {"type": 'str', "default": 'Immediate',
+                   "choices": ['Immediate', 'OnReset', 'AtMaintenanceWindowStart', 'InMaintenanceWindowOnReset']},
+    "maintenance_window": {"type": 'dict',
+                           "options": {"start_time": {"type": 'str', "required": True},
+                                       "duration": {"type": 'int', "required": False, "default": 900}}},
+    "job_wait": {"required": False, "type": "bool", "default": False},
+    "job_wait_timeout": {"required": False, "type": "int", "default": 120},
+    "size": {"required": False, "type": "int"}
+}
+MUTUALLY_EXCLUSIVE = [('attributes', 'command'), ("target", "size")]
+REQUIRED_ONE_OF = [('attributes', 'command')]
+REQUIRED_IF = [
+    ["command", "SetControllerKey", ["controller_id", "key", "key_id"]],
+    ["command", "ReKey", ["controller_id", "mode"]], ["command", "ResetConfig", ["controller_id"]],
+    ["command", "RemoveControllerKey", ["controller_id"]], ["command", "AssignSpare", ["target"]],
+    ["command", "UnassignSpare", ["target"]], ["command", "EnableControllerEncryption", ["controller_id"]],
+    ["command", "BlinkTarget", ["target", "volume_id"], True],
+    ["command", "UnBlinkTarget", ["target", "volume_id"], True], ["command", "ConvertToRAID", ["target"]],
+    ["command", "ConvertToNonRAID", ["target"]], ["command", "ChangePDStateToOnline", ["target"]],
+    ["command", "ChangePDStateToOffline", ["target"]],
+    ["command", "LockVirtualDisk", ["volume_id"]], ["command", "OnlineCapacityExpansion", ["volume_id"]],
+    ["command", "OnlineCapacityExpansion", ["target", "size"], True],
+    ["command", "SecureErase", ["controller_id", "target"]],
+    ["apply_time", "AtMaintenanceWindowStart", ("maintenance_window",)],
+    ["apply_time", "InMaintenanceWindowOnReset", ("maintenance_window",)]
+]
+
+
+def get_controller_id(fqdd):
+    return fqdd.rpartition(":")[2]
 
 
 def check_id_exists(module, redfish_obj, key, item_id, uri):
@@ -602,6 +658,7 @@ def check_id_exists(module, redfish_obj, key, item_id, uri):
             module.exit_json(msg=msg, failed=True)
     except HTTPError as err:
         module.exit_json(msg=msg, error_info=json.load(err), failed=True)
+    return resp.json_data
 
 
 def ctrl_key(module, redfish_obj):
@@ -609,13 +666,13 @@ def ctrl_key(module, redfish_obj):
     controller_id = module.params.get("controller_id")
     command, mode = module.params["command"], module.params["mode"]
     key, key_id = module.params.get("key"), module.params.get("key_id")
-    check_id_exists(module, redfish_obj, "controller_id", controller_id, CONTROLLER_URI)
-    ctrl_resp = redfish_obj.invoke_request("GET", CONTROLLER_URI.format(system_id=SYSTEM_ID,
-                                                                        controller_id=controller_id))
-    security_status = ctrl_resp.json_data.get("SecurityStatus")
+    if command == "ReKey" and module.check_mode:
+        module.exit_json(msg=CHANGES_FOUND, changed=True)
+    ctrl_data = check_id_exists(module, redfish_obj, "controller_id", controller_id, CONTROLLER_URI)
+    security_status = ctrl_data.get("SecurityStatus")
     if security_status == "EncryptionNotCapable":
         module.fail_json(msg=ENCRYPT_ERR_MSG.format(controller_id))
-    ctrl_key_id = ctrl_resp.json_data.get("KeyID")
+    ctrl_key_id = ctrl_data.get("KeyID")
     if command == "SetControllerKey":
         if module.check_mode and ctrl_key_id is None:
             module.exit_json(msg=CHANGES_FOUND, changed=True)
@@ -623,8 +680,6 @@ def ctrl_key(module, redfish_obj):
             module.exit_json(msg=NO_CHANGES_FOUND)
         payload = {"TargetFQDD": controller_id, "Key": key, "Keyid": key_id}
     elif command == "ReKey":
-        if module.check_mode:
-            module.exit_json(msg=CHANGES_FOUND, changed=True)
         if mode == "LKM":
             payload = {"TargetFQDD": controller_id, "Mode": mode, "NewKey": key,
                        "Keyid": key_id, "OldKey": module.params.get("old_key")}
@@ -646,7 +701,7 @@ def ctrl_key(module, redfish_obj):
         if mode == "LKM":
             payload["Key"] = key
             payload["Keyid"] = key_id
-    resp = redfish_obj.invoke_request("POST", RAID_ACTION_URI.format(system_id=SYSTEM_ID, action=command),
+    resp = redfish_obj.invoke_request("POST", RAID_ACTION_URI.format(action=command),
                                       data=payload)
     job_uri = resp.headers.get("Location")
     job_id = job_uri.split("/")[-1]
@@ -656,16 +711,14 @@ def ctrl_key(module, redfish_obj):
 def ctrl_reset_config(module, redfish_obj):
     resp, job_uri, job_id = None, None, None
     controller_id = module.params.get("controller_id")
-    check_id_exists(module, redfish_obj, "controller_id", controller_id, CONTROLLER_URI)
-    member_resp = redfish_obj.invoke_request("GET", VOLUME_URI.format(system_id=SYSTEM_ID, controller_id=controller_id))
-    members = member_resp.json_data.get("Members")
+    volume_data = check_id_exists(module, redfish_obj, "controller_id", controller_id, VOLUME_URI)
+    members = volume_data.get("Members")
     if module.check_mode and members:
         module.exit_json(msg=CHANGES_FOUND, changed=True)
     elif (module.check_mode and not members) or (not module.check_mode and not members):
         module.exit_json(msg=NO_CHANGES_FOUND)
     else:
-        resp = redfish_obj.invoke_request("POST", RAID_ACTION_URI.format(system_id=SYSTEM_ID,
-                                                                         action=module.params["command"]),
+        resp = redfish_obj.invoke_request("POST", RAID_ACTION_URI.format(action=module.params["command"]),
                                           data={"TargetFQDD": controller_id})
         job_uri = resp.headers.get("Location")
         job_id = job_uri.split("/")[-1]
@@ -676,28 +729,24 @@ def hot_spare_config(module, redfish_obj):
     target, command = module.params.get("target"), module.params["command"]
     resp, job_uri, job_id = None, None, None
     volume = module.params.get("volume_id")
-    controller_id = target[0].split(":")[-1]
     drive_id = target[0]
+    controller_id = get_controller_id(drive_id)
     try:
-        pd_resp = redfish_obj.invoke_request("GET", PD_URI.format(controller_id=controller_id, drive_id=drive_id))
+        pd_resp = redfish_obj.invoke_request("GET", HOT_SPARE_TYPE_URI.format(controller_id=controller_id,
+                                                                              drive_id=drive_id))
     except HTTPError:
         module.fail_json(msg=PD_ERROR_MSG.format(drive_id))
     else:
         hot_spare = pd_resp.json_data.get("HotspareType")
-        if module.check_mode and hot_spare == "None" and command == "AssignSpare" or \
-                (module.check_mode and not hot_spare == "None" and command == "UnassignSpare"):
-            module.exit_json(msg=CHANGES_FOUND, changed=True)
-        elif (module.check_mode and hot_spare in ["Dedicated", "Global"] and command == "AssignSpare") or \
-                (not module.check_mode and hot_spare in ["Dedicated", "Global"] and command == "AssignSpare") or \
-                (module.check_mode and hot_spare == "None" and command == "UnassignSpare") or \
-                (not module.check_mode and hot_spare == "None" and command == "UnassignSpare"):
+        if (command, hot_spare) in HOT_SPARE_NO_CHANGES:
             module.exit_json(msg=NO_CHANGES_FOUND)
+        elif module.check_mode:
+            module.exit_json(msg=CHANGES_FOUND, changed=True)
         else:
             payload = {"TargetFQDD": drive_id}
             if volume is not None and command == "AssignSpare":
                 payload["VirtualDiskArray"] = volume
-            resp = redfish_obj.invoke_request("POST", RAID_ACTION_URI.format(system_id=SYSTEM_ID,
-                                                                             action=command),
+            resp = redfish_obj.invoke_request("POST", RAID_ACTION_URI.format(action=command),
                                               data=payload)
             job_uri = resp.headers.get("Location")
             job_id = job_uri.split("/")[-1]
@@ -707,7 +756,7 @@ def hot_spare_config(module, redfish_obj):
 def change_pd_status(module, redfish_obj):
     resp, job_uri, job_id = None, None, None
     command, target = module.params["command"], module.params.get("target")
-    controller_id = target[0].split(":")[-1]
+    controller_id = get_controller_id(target[0])
     drive_id = target[0]
     state = "Online" if command == "ChangePDStateToOnline" else "Offline"
     try:
@@ -721,42 +770,46 @@ def change_pd_status(module, redfish_obj):
         elif (module.check_mode and state == raid_status) or (not module.check_mode and state == raid_status):
             module.exit_json(msg=NO_CHANGES_FOUND)
         else:
-            resp = redfish_obj.invoke_request("POST", RAID_ACTION_URI.format(system_id=SYSTEM_ID,
-                                                                             action="ChangePDState"),
+            resp = redfish_obj.invoke_request("POST", RAID_ACTION_URI.format(action="ChangePDState"),
                                               data={"TargetFQDD": drive_id, "State": state})
             job_uri = resp.headers.get("Location")
             job_id = job_uri.split("/")[-1]
     return resp, job_uri, job_id
 
 
+def get_controller_drives(redfish_obj, controller_id):
+    storage_resp = redfish_obj.invoke_request("GET", STORAGE_DRIVES_URI.format(system_id=SYSTEM_ID,
+                                                                               controller_id=controller_id))
+    return {drive[ODATA_ID].rpartition("/")[2]: drive for drive in storage_resp.json_data.get("Drives", [])}
+
+
 def convert_raid_status(module, redfish_obj):
     resp, job_uri, job_id = None, None, None
     command, target = module.params["command"], module.params.get("target")
-    ctrl, pd_ready_state = None, []
+    ctrl, pd_ready_state, ctrl_drives = None, [], {}
     try:
         for ctrl in target:
-            controller_id = ctrl.split(":")[-1]
-            pd_resp = redfish_obj.invoke_request("GET", PD_URI.format(controller_id=controller_id, drive_id=ctrl))
-            raid_status = pd_resp.json_data["Oem"]["Dell"]["DellPhysicalDisk"]["RaidStatus"]
+            controller_id = get_controller_id(ctrl)
+            if controller_id not in ctrl_drives:
+                ctrl_drives[controller_id] = get_controller_drives(redfish_obj, controller_id)
+            drive = ctrl_drives[controller_id].get(ctrl)
+            if drive is None:
+                module.fail_json(msg=PD_ERROR_MSG.format(ctrl))
+            if "Oem" not in drive:
+                drive = redfish_obj.invoke_request("GET", drive[ODATA_ID]).json_data
+            raid_status = drive["Oem"]["Dell"]["DellPhysicalDisk"]["RaidStatus"]
             pd_ready_state.append(raid_status)
     except HTTPError:
         module.fail_json(msg=PD_ERROR_MSG.format(ctrl))
     else:
-        if (command == "ConvertToRAID" and module.check_mode and 0 < pd_ready_state.count("NonRAID")) or \
-                (command == "ConvertToNonRAID" and module.check_mode and 0 < pd_ready_state.count("Ready")):
+        desired_status, convertible_status = RAID_STATUS_CONVERSION[command]
+        status_count = Counter(pd_ready_state)
+        if module.check_mode and status_count[convertible_status]:
             module.exit_json(msg=CHANGES_FOUND, changed=True)
-        elif (command == "ConvertToRAID" and module.check_mode and
-              len(pd_ready_state) == pd_ready_state.count("Ready")) or \
-                (command == "ConvertToRAID" and not module.check_mode and
-                 len(pd_ready_state) == pd_ready_state.count("Ready")) or \
-                (command == "ConvertToNonRAID" and module.check_mode and
-                 len(pd_ready_state) == pd_ready_state.count("NonRAID")) or \
-                (command == "ConvertToNonRAID" and not module.check_mode and
-                 len(pd_ready_state) == pd_ready_state.count("NonRAID")):
+        elif status_count[desired_status] == len(pd_ready_state):
             module.exit_json(msg=NO_CHANGES_FOUND)
         else:
-            resp = redfish_obj.invoke_request("POST", RAID_ACTION_URI.format(system_id=SYSTEM_ID,
-                                                                             action=command),
+            resp = redfish_obj.invoke_request("POST", RAID_ACTION_URI.format(action=command),
                                               data={"PDArray": target})
             job_uri = resp.headers.get("Location")
             job_id = job_uri.split("/")[-1]
@@ -766,19 +819,12 @@ def convert_raid_status(module, redfish_obj):
 def target_identify_pattern(module, redfish_obj):
     target, volume = module.params.get("target"), module.params.get("volume_id")
     command = module.params.get("command")
-    payload = {"TargetFQDD": None}
-
-    if target is not None and volume is None:
-        payload = {"TargetFQDD": target[0]}
-    elif volume is not None and target is None:
-        payload = {"TargetFQDD": volume[0]}
-    elif target is not None and volume is not None:
-        payload = {"TargetFQDD": target[0]}
+    fqdd = target if target is not None else volume
+    payload = {"TargetFQDD": fqdd[0] if fqdd else None}
 
     if module.check_mode:
         module.exit_json(msg=CHANGES_FOUND, changed=True)
-    resp = redfish_obj.invoke_request("POST", RAID_ACTION_URI.format(system_id=SYSTEM_ID,
-                                                                     action=command),
+    resp = redfish_obj.invoke_request("POST", RAID_ACTION_URI.format(action=command),
                                       data=payload)
     return resp
 
@@ -786,22 +832,21 @@ def target_identify_pattern(module, redfish_obj):
 def lock_virtual_disk(module, redfish_obj):
     volume = module.params.get("volume_id")
     resp, job_uri, job_id = None, None, None
-    controller_id = volume[0].split(":")[-1]
+    controller_id = get_controller_id(volume[0])
     check_id_exists(module, redfish_obj, "controller_id", controller_id, CONTROLLER_URI)
-    volume_uri = VOLUME_URI + "/{volume_id}"
     try:
-        volume_resp = redfish_obj.invoke_request("GET", volume_uri.format(system_id=SYSTEM_ID,
-                                                                          controller_id=controller_id,
-                                                                          volume_id=volume[0]))
-        links = volume_resp.json_data.get("Links")
+        volume_resp = redfish_obj.invoke_request("GET", VOLUME_DRIVES_URI.format(system_id=SYSTEM_ID,
+                                                                                 controller_id=controller_id,
+                                                                                 volume_id=volume[0]))
+        volume_data = volume_resp.json_data
+        links = volume_data.get("Links")
         if links:
-            for disk in volume_resp.json_data.get("Links").get("Drives"):
-                drive_link = disk[ODATA_ID]
-                drive_resp = redfish_obj.invoke_request("GET", drive_link)
-                encryption_ability = drive_resp.json_data.get("EncryptionAbility")
-                if encryption_ability != "SelfEncryptingDrive":
+            for drive in links.get("Drives"):
+                if "EncryptionAbility" not in drive:
+                    drive = redfish_obj.invoke_request("GET", drive[ODATA_ID]).json_data
+                if drive.get("EncryptionAbility") != "SelfEncryptingDrive":
                     module.fail_json(msg=PHYSICAL_DISK_ERR)
-        lock_status = volume_resp.json_data.get("Oem").get("Dell").get("DellVolume").get("LockStatus")
+        lock_status = volume_data.get("Oem").get("Dell").get("DellVolume").get("LockStatus")
     except HTTPError:
         module.fail_json(msg=PD_ERROR_MSG.format(controller_id))
     else:
@@ -810,8 +855,7 @@ def lock_virtual_disk(module, redfish_obj):
         elif lock_status == "Locked":
             module.exit_json(msg=NO_CHANGES_FOUND)
         else:
-            resp = redfish_obj.invoke_request("POST", RAID_ACTION_URI.format(system_id=SYSTEM_ID,
-                                                                             action="LockVirtualDisk"),
+            resp = redfish_obj.invoke_request("POST", RAID_ACTION_URI.format(action="LockVirtualDisk"),
                                               data={"TargetFQDD": volume[0]})
             job_uri = resp.headers.get("Location")
             job_id = job_uri.split("/")[-1]
@@ -828,17 +872,18 @@ def online_capacity_expansion(module, redfish_obj):
     if len(volume_id) != 1:
         module.exit_json(msg=TARGET_ERR_MSG.format("virtual drive"), failed=True)
 
-    controller_id = volume_id[0].split(":")[-1]
-    volume_uri = VOLUME_URI + "/{volume_id}"
+    volume_fqdd = volume_id[0]
+    controller_id = get_controller_id(volume_fqdd)
     try:
-        volume_resp = redfish_obj.invoke_request("GET", volume_uri.format(system_id=SYSTEM_ID,
-                                                                          controller_id=controller_id,
-                                                                          volume_id=volume_id[0]))
+        volume_resp = redfish_obj.invoke_request("GET", VOLUME_ID_URI.format(system_id=SYSTEM_ID,
+                                                                             controller_id=controller_id,
+                                                                             volume_id=volume_fqdd))
     except HTTPError:
-        module.exit_json(msg=VD_ERROR_MSG.format(volume_id[0]), failed=True)
+        module.exit_json(msg=VD_ERROR_MSG.format(volume_fqdd), failed=True)
 
     try:
-        raid_type = volume_resp.json_data.get("RAIDType")
+        volume_data = volume_resp.json_data
+        raid_type = volume_data.get("RAIDType")
         if raid_type in ['RAID50', 'RAID60']:
             module.exit_json(msg=OCE_RAID_TYPE_ERR.format(raid_type), failed=True)
 
@@ -849,28 +894,25 @@ def online_capacity_expansion(module, redfish_obj):
             if raid_type == 'RAID1':
                 module.fail_json(msg=OCE_TARGET_RAID1_ERR)
 
-            current_pd = []
-            links = volume_resp.json_data.get("Links")
+            current_pd = set()
+            links = volume_data.get("Links")
             if links:
-                for disk in volume_resp.json_data.get("Links").get("Drives"):
-                    drive = disk[ODATA_ID].split('/')[-1]
-                    current_pd.append(drive)
+                current_pd.update(disk[ODATA_ID].split('/')[-1] for disk in links.get("Drives"))
             drives_to_add = [each_drive for each_drive in target if each_drive not in current_pd]
             if module.check_mode and drives_to_add and len(drives_to_add) % OCE_MIN_PD_RAID_MAPPING[raid_type] == 0:
                 module.exit_json(msg=CHANGES_FOUND, changed=True)
             elif len(drives_to_add) == 0 or len(drives_to_add) % OCE_MIN_PD_RAID_MAPPING[raid_type] != 0:
                 module.exit_json(msg=NO_CHANGES_FOUND)
-            payload = {"TargetFQDD": volume_id[0], "PDArray": drives_to_add}
+            payload = {"TargetFQDD": volume_fqdd, "PDArray": drives_to_add}
 
         elif size:
-            vd_size = volume_resp.json_data.get("CapacityBytes")
-            vd_size_MB = vd_size // (1024 * 1024)
+            vd_size = volume_data.get("CapacityBytes")
+            vd_size_MB = vd_size >> 20
             if (size - vd_size_MB) < 100:
                 module.exit_json(msg=OCE_SIZE_100MB.format(vd_size_MB), failed=True)
-            payload = {"TargetFQDD": volume_id[0], "Size": size}
+            payload = {"TargetFQDD": volume_fqdd, "Size": size}
 
-        resp = redfish_obj.invoke_request("POST", RAID_ACTION_URI.format(system_id=SYSTEM_ID,
-                                          action="OnlineCapacityExpansion"),
+        resp = redfish_obj.invoke_request("POST", RAID_ACTION_URI.format(action="OnlineCapacityExpansion"),
                                           data=payload)
         job_uri = resp.headers.get("Location")
         job_id = job_uri.split("/")[-1]
@@ -880,12 +922,14 @@ def online_capacity_expansion(module, redfish_obj):
         module.exit_json(msg=err, failed=True)
 
 
+def get_member_by_id(id, member_list):
+    return next((each_dict for each_dict in member_list
+                 if each_dict[ODATA_ID].rpartition("/")[2] == id), None)
+
+
 def match_id_in_list(id, member_list):
-    for each_dict in member_list:
-        url = each_dict[ODATA_ID]
-        _id = url.split("/")[-1]
-        if id == _id:
-            return url
+    member = get_member_by_id(id, member_list)
+    return member[ODATA_ID] if member is not None else None
 
 
 def validate_secure_erase(module, redfish_obj):
@@ -898,11 +942,13 @@ def validate_secure_erase(module, redfish_obj):
     if err_msg:
         module.exit_json(msg=err_msg, failed=True)
     storage_uri = get_dynamic_uri(redfish_obj, uri, "Storage")['@odata.id']
-    storage_member_list = get_dynamic_uri(redfish_obj, storage_uri, "Members")
-    controller_uri = match_id_in_list(controller_id, storage_member_list)
-    if controller_uri is None:
+    storage_member_list = get_dynamic_uri(redfish_obj, storage_uri + EXPAND_MEMBERS_QUERY, "Members")
+    controller = get_member_by_id(controller_id, storage_member_list)
+    if controller is None:
         module.exit_json(msg=CNTRL_ERROR_MSG.format(controller_id), skipped=True)
-    drives_list = get_dynamic_uri(redfish_obj, controller_uri, 'Drives')
+    drives_list = controller.get("Drives")
+    if drives_list is None:
+        drives_list = get_dynamic_uri(redfish_obj, controller[ODATA_ID], 'Drives')
     drive_uri = match_id_in_list(drive_id, drives_list)
     if drive_uri is None:
         module.exit_json(msg=PD_ERROR_MSG.format(drive_id), skipped=True)
@@ -922,11 +968,11 @@ def validate_secure_erase(module, redfish_obj):
         if capable != "CryptographicErasePD":
             module.exit_json(msg=DRIVE_NOT_SECURE_ERASE.format(drive_id),
                              skipped=True)
-    return drive_uri
+    return drive_detail
 
 
 def secure_erase(module, redfish_obj):
-    drive_uri = validate_secure_erase(module, redfish_obj)
+    drive_detail = validate_secure_erase(module, redfish_obj)
     job_type_list = ["RAIDConfiguration", "RealTimeNoRebootConfiguration"]
     scheduled_job = get_scheduled_job_resp(redfish_obj, job_type_list)
     if scheduled_job:
@@ -934,8 +980,7 @@ def secure_erase(module, redfish_obj):
         job_uri = JOB_URI_OEM.format(job_id=job_id)
         module.exit_json(msg=JOB_EXISTS, status=scheduled_job, changed=False,
                          task={"id": job_id, "uri": job_uri})
-    action_uri = get_dynamic_uri(redfish_obj, drive_uri, "Actions")
-    secure_erase_uri = action_uri.get("#Drive.SecureErase").get("target")
+    secure_erase_uri = drive_detail.get("Actions").get("#Drive.SecureErase").get("target")
     if module.check_mode:
         module.exit_json(msg=CHANGES_FOUND, changed=True)
     resp = redfish_obj.invoke_request("POST", secure_erase_uri, data="{}",
@@ -978,9 +1023,9 @@ def validate_inputs(module):
 
 def get_current_time(redfish_obj):
     try:
-        resp = redfish_obj.invoke_request("GET", MANAGER_URI)
-        curr_time = resp.json_data.get("DateTime")
-        date_offset = resp.json_data.get("DateTimeLocalOffset")
+        resp_data = redfish_obj.invoke_request("GET", MANAGER_URI).json_data
+        curr_time = resp_data.get("DateTime")
+        date_offset = resp_data.get("DateTimeLocalOffset")
     except Exception:
         return None, None
     return curr_time, date_offset
@@ -1007,20 +1052,13 @@ def get_attributes(module, redfish_obj):
 
 
 def check_attr_exists(module, curr_attr, inp_attr):
-    invalid_attr = []
-    pending_attr = {}
-    diff = 0
-    for each in inp_attr:
-        if each not in curr_attr.keys():
-            invalid_attr.append(each)
-        elif curr_attr[each] != inp_attr[each]:
-            diff = 1
-            pending_attr[each] = inp_attr[each]
+    invalid_attr = [each for each in inp_attr if each not in curr_attr]
     if invalid_attr:
         module.exit_json(msg=INVALID_ATTRIBUTES.format(invalid_attr), failed=True)
-    if diff and module.check_mode:
+    pending_attr = {key: val for key, val in inp_attr.items() if curr_attr[key] != val}
+    if pending_attr and module.check_mode:
         module.exit_json(msg=CHANGES_FOUND, changed=True)
-    elif not diff:
+    elif not pending_attr:
         module.exit_json(msg=NO_CHANGES_FOUND)
     return pending_attr
 
@@ -1052,10 +1090,11 @@ def apply_attributes(module, redfish_obj, pending, time_settings):
         resp = redfish_obj.invoke_request("PATCH", SETTINGS_URI.format(system_id=SYSTEM_ID,
                                                                        controller_id=module.params["controller_id"]),
                                           data=payload)
-        if resp.status_code == 202 and "error" in resp.json_data:
-            msg_err_id = resp.json_data.get("error").get("@Message.ExtendedInfo", [{}])[0].get("MessageId")
+        resp_data = resp.json_data if resp.status_code == 202 else {}
+        if "error" in resp_data:
+            msg_err_id = resp_data.get("error").get("@Message.ExtendedInfo", [{}])[0].get("MessageId")
             if "Created" not in msg_err_id:
-                module.exit_json(msg=ERR_MSG, error_info=resp.json_data, failed=True)
+                module.exit_json(msg=ERR_MSG, error_info=resp_data, failed=True)
     except HTTPError as err:
         err = json.load(err).get("error")
         module.exit_json(msg=ERR_MSG, error_info=err, failed=True)
@@ -1093,60 +1132,23 @@ def job_condition_check(module, redfish_obj, job_id, job_uri,
         module.exit_json(msg=job_completion_msg, changed=changed, failed=failed,
                          task={"id": job_id, "uri": job_uri}, status=job_data)
     else:
-        resp, msg = wait_for_job_completion(redfish_obj, job_uri, job_wait=job_wait,
-                                            wait_timeout=module.params["job_wait_timeout"])
+        resp = redfish_obj.invoke_request("GET", job_uri)
         job_data = strip_substr_dict(resp.json_data)
         module.exit_json(msg=job_submission_msg, task={"id": job_id, "uri": job_uri},
                          status=job_data)
 
 
 def main():
-    specs = {
-        "attributes": {"type": 'dict'},
-        "command": {"required": False,
-                    "choices": ["ResetConfig", "AssignSpare", "SetControllerKey", "RemoveControllerKey",
-                                "ReKey", "UnassignSpare", "EnableControllerEncryption", "BlinkTarget",
-                                "UnBlinkTarget", "ConvertToRAID", "ConvertToNonRAID", "ChangePDStateToOnline",
-                                "ChangePDStateToOffline", "LockVirtualDisk", "OnlineCapacityExpansion", "SecureErase"]},
-        "controller_id": {"required": False, "type": "str"},
-        "volume_id": {"required": False, "type": "list", "elements": "str"},
-        "target": {"required": False, "type": "list", "elements": "str", "aliases": ["drive_id"]},
-        "key": {"required": False, "type": "str", "no_log": True},
-        "key_id": {"required": False, "type": "str"},
-        "old_key": {"required": False, "type": "str", "no_log": True},
-        "mode": {"required": False, "choices": ["LKM", "SEKM"], "default": "LKM"},
-        "apply_time": {"type": 'str', "default": 'Immediate',
-                       "choices": ['Immediate', 'OnReset', 'AtMaintenanceWindowStart', 'InMaintenanceWindowOnReset']},
-        "maintenance_window": {"type": 'dict',
-                               "options": {"start_time": {"type": 'str', "required": True},
-                                           "duration": {"type": 'int', "required": False, "default": 900}}},
-        "job_wait": {"required": False, "type": "bool", "default": False},
-        "job_wait_timeout": {"required": False, "type": "int", "default": 120},
-        "size": {"required": False, "type": "int"}
-    }
     module = RedfishAnsibleModule(
-        argument_spec=specs,
-        mutually_exclusive=[('attributes', 'command'), ("target", "size")],
-        required_one_of=[('attributes', 'command')],
-        required_if=[
-            ["command", "SetControllerKey", ["controller_id", "key", "key_id"]],
-            ["command", "ReKey", ["controller_id", "mode"]], ["command", "ResetConfig", ["controller_id"]],
-            ["command", "RemoveControllerKey", ["controller_id"]], ["command", "AssignSpare", ["target"]],
-            ["command", "UnassignSpare", ["target"]], ["command", "EnableControllerEncryption", ["controller_id"]],
-            ["command", "BlinkTarget", ["target", "volume_id"], True],
-            ["command", "UnBlinkTarget", ["target", "volume_id"], True], ["command", "ConvertToRAID", ["target"]],
-            ["command", "ConvertToNonRAID", ["target"]], ["command", "ChangePDStateToOnline", ["target"]],
-            ["command", "ChangePDStateToOffline", ["target"]],
-            ["command", "LockVirtualDisk", ["volume_id"]], ["command", "OnlineCapacityExpansion", ["volume_id"]],
-            ["command", "OnlineCapacityExpansion", ["target", "size"], True],
-            ["command", "LockVirtualDisk", ["volume_id"]],
-            ["command", "SecureErase", ["controller_id", "target"]],
-            ["apply_time", "AtMaintenanceWindowStart", ("maintenance_window",)],
-            ["apply_time", "InMaintenanceWindowOnReset", ("maintenance_window",)]
-        ],
+        argument_spec=ARGUMENT_SPEC,
+        mutually_exclusive=MUTUALLY_EXCLUSIVE,
+        required_one_of=REQUIRED_ONE_OF,
+        required_if=REQUIRED_IF,
         supports_check_mode=True)
     if not bool(module.params["attributes"]):
         validate_inputs(module)
+    if module.check_mode and module.params["command"] in ALWAYS_CHANGED_COMMANDS:
+        module.exit_json(msg=CHANGES_FOUND, changed=True)
     try:
         command = module.params["command"]
         with Redfish(module.params, req_session=True) as redfish_obj:
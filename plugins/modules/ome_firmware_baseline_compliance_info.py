@@ -60,6 +60,14 @@ options:
         - Devices without reports are ignored.
     type: list
     elements: str
+  components:
+    description:
+        - Whether to retrieve the component level compliance details of each device.
+        - If C(false), only the device level compliance summary is retrieved, which reduces the size of the report.
+        - This is applicable only when I(baseline_name) is provided.
+    type: bool
+    default: true
+    version_added: 9.8.0
 requirements:
     - "python >= 3.9.6"
 author: "Sajna Shetty(@Sajna-Shetty)"
@@ -107,6 +115,15 @@ EXAMPLES = r'''
     password: "password"
     ca_path: "/path/to/ca_cert.pem"
     baseline_name: "baseline_name"
+
+- name: Retrieves device compliance summary for a specified baseline without component details
+  dellemc.openmanage.ome_firmware_baseline_compliance_info:
+    hostname: "192.168.0.1"
+    username: "username"
+    password: "password"
+    ca_path: "/path/to/ca_cert.pem"
+    baseline_name: "baseline_name"
+    components: false
 '''
 
 RETURN = r'''
@@ -118,7 +135,9 @@ msg:
   sample: "Failed to fetch the compliance baseline information."
 baseline_compliance_info:
   type: dict
-  description: Details of the baseline compliance report.
+  description:
+    - Details of the baseline compliance report.
+    - C(ComponentComplianceReports) is not included for each device when I(components) is C(false).
   returned: success
   sample: [
             {
@@ -227,6 +246,7 @@ import json
 from ssl import SSLError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+from ansible.module_utils.six.moves.urllib.parse import quote
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 
 
@@ -238,102 +258,100 @@ group_service_path = "GroupService/Groups"
 EXIT_MESSAGE = "Unable to retrieve baseline list either because the device ID(s) entered are invalid, " \
                "the ID(s) provided are not associated with a baseline or a group is used as a target for a baseline."
 MSG_ID = "CUPD3090"
+COMPLIANCE_SUMMARY_FIELDS = "Id,DeviceId,ServiceTag,DeviceName,DeviceModel,DeviceTypeId,DeviceTypeName," \
+                            "ComplianceStatus,FirmwareStatus,RebootRequired"
+SERVICE_TAG_FILTER_MAX_LENGTH = 6000
 
 
-def _get_device_id_from_service_tags(service_tags, rest_obj, module):
+def _get_service_tag_filters(service_tags):
+    """
+    Build $filter values of or-joined DeviceServiceTag clauses, each within the URL length limit
+    :arg service_tags: list of service tags
+    :returns: list of $filter values
     """
-    Get device ids from device service tag
+    filters, clauses, length = [], [], 0
+    for tag in service_tags:
+        clause = "DeviceServiceTag eq '{0}'".format(tag.replace("'", "''"))
+        clause_length = len(quote(" or " + clause))
+        if clauses and length + clause_length > SERVICE_TAG_FILTER_MAX_LENGTH:
+            filters.append(" or ".join(clauses))
+            clauses, length = [], 0
+        clauses.append(clause)
+        length += clause_length
+    if clauses:
+        filters.append(" or ".join(clauses))
+    return filters
+
+
+def _get_device_id_from_service_tags(service_tags, rest_obj):
+    """
+    Get device ids from device service tag, filtering the device collection on all tags at once
     Returns :dict : device_id to service_tag map
     :arg service_tags: service tag
     :arg rest_obj: RestOME class object in case of request with session.
     :returns: dict eg: {1345:"MXL1245"}
     """
-    try:
-        resp = rest_obj.get_all_report_details("DeviceService/Devices")
-        devices_list = resp["report_list"]
-        if devices_list:
-            service_tag_dict = {}
-            for item in devices_list:
-                if item["DeviceServiceTag"] in service_tags:
-                    service_tag_dict.update({item["Id"]: item["DeviceServiceTag"]})
-            return service_tag_dict
-        else:
-            module.exit_json(msg="Unable to fetch the device information.", baseline_compliance_info=[])
-    except (URLError, HTTPError, SSLValidationError, ConnectionError, TypeError, ValueError) as err:
-        raise err
+    tags = list(dict.fromkeys(tag.upper() for tag in service_tags))
+    tag_set = frozenset(tags)
+    service_tag_dict = {}
+    for tag_filter in _get_service_tag_filters(tags):
+        resp_val = rest_obj.get_all_items_with_pagination(device_is_list_path, query_param={"$filter": tag_filter})
+        service_tag_dict.update({item["Id"]: item["DeviceServiceTag"] for item in resp_val["value"]
+                                 if (item["DeviceServiceTag"] or "").upper() in tag_set})
+    return service_tag_dict
 
 
 def get_device_ids_from_group_ids(module, grou_id_list, rest_obj):
-    try:
-        device_id_list = []
-        for group_id in grou_id_list:
-            group_id_path = group_service_path + "({group_id})/Devices".format(group_id=group_id)
-            resp_val = rest_obj.get_all_items_with_pagination(group_id_path)
-            grp_list_value = resp_val["value"]
-            if grp_list_value:
-                for device_item in grp_list_value:
-                    device_id_list.append(device_item["Id"])
-        if len(device_id_list) == 0:
-            module.exit_json(msg="Unable to fetch the device ids from specified device_group_names.",
-                             baseline_compliance_info=[])
-        return device_id_list
-    except (URLError, HTTPError, SSLValidationError, ConnectionError, TypeError, ValueError) as err:
-        raise err
+    device_ids = {}
+    for group_id in dict.fromkeys(grou_id_list):
+        group_id_path = group_service_path + "({group_id})/Devices".format(group_id=group_id)
+        resp_val = rest_obj.get_all_items_with_pagination(group_id_path)
+        grp_list_value = resp_val["value"]
+        if grp_list_value:
+            device_ids.update(dict.fromkeys(device_item["Id"] for device_item in grp_list_value))
+    if len(device_ids) == 0:
+        module.exit_json(msg="Unable to fetch the device ids from specified device_group_names.",
+                         baseline_compliance_info=[])
+    return list(device_ids)
 
 
 def get_device_ids_from_group_names(module, rest_obj):
-    try:
-        grp_name_list = module.params.get("device_group_names")
-        resp = rest_obj.get_all_report_details(group_service_path)
-        group_id_list = []
-        grp_list_resp = resp["report_list"]
-        if grp_list_resp:
-            for name in grp_name_list:
-                for group in grp_list_resp:
-                    if group["Name"] == name:
-                        group_id_list.append(group['Id'])
-                        break
-        else:
-            module.exit_json(msg="Unable to fetch the specified device_group_names.",
-                             baseline_compliance_info=[])
-        return get_device_ids_from_group_ids(module, group_id_list, rest_obj)
-    except (URLError, HTTPError, SSLValidationError, ConnectionError, TypeError, ValueError) as err:
-        raise err
+    grp_name_list = module.params.get("device_group_names")
+    resp = rest_obj.get_all_report_details(group_service_path)
+    group_id_list = []
+    grp_list_resp = resp["report_list"]
+    if grp_list_resp:
+        group_name_map = {group["Name"]: group["Id"] for group in grp_list_resp}
+        group_id_list = [group_name_map[name] for name in grp_name_list if name in group_name_map]
+    else:
+        module.exit_json(msg="Unable to fetch the specified device_group_names.",
+                         baseline_compliance_info=[])
+    return get_device_ids_from_group_ids(module, group_id_list, rest_obj)
 
 
 def get_identifiers(rest_obj, module):
-    if module.params.get("device_ids") is not None:
-        return module.params.get("device_ids"), "device_ids"
-    elif module.params.get("device_group_names") is not None:
+    module_params = module.params
+    device_ids = module_params.get("device_ids")
+    if device_ids is not None:
+        return device_ids, "device_ids"
+    elif module_params.get("device_group_names") is not None:
         return get_device_ids_from_group_names(module, rest_obj), "device_group_names"
     else:
-        service_tags = module.params.get("device_service_tags")
-        service_tags_mapper = _get_device_id_from_service_tags(service_tags, rest_obj, module)
+        service_tags = module_params.get("device_service_tags")
+        service_tags_mapper = _get_device_id_from_service_tags(service_tags, rest_obj)
         return list(service_tags_mapper.keys()), "device_service_tags"
 
 
 def get_baseline_id_from_name(rest_obj, module):
-    try:
-        baseline_name = module.params.get("baseline_name")
-        baseline_id = 0
-        if baseline_name is not None:
-            resp_val = rest_obj.get_all_items_with_pagination(base_line_path)
-            baseline_list = resp_val["value"]
-            if baseline_list:
-                for baseline in baseline_list:
-                    if baseline["Name"] == baseline_name:
-                        baseline_id = baseline["Id"]
-                        break
-                else:
-                    module.exit_json(msg="Specified baseline_name does not exist in the system.",
-                                     baseline_compliance_info=[])
-            else:
-                module.exit_json(msg="No baseline exists in the system.", baseline_compliance_info=[])
-        else:
-            module.fail_json(msg="baseline_name is a mandatory option.")
-        return baseline_id
-    except (URLError, HTTPError, SSLValidationError, ConnectionError, TypeError, ValueError) as err:
-        raise err
+    baseline_name = module.params.get("baseline_name")
+    if baseline_name is None:
+        module.fail_json(msg="baseline_name is a mandatory option.")
+    query_param = {"$filter": "Name eq '{0}'".format(baseline_name.replace("'", "''"))}
+    resp_val = rest_obj.get_all_items_with_pagination(base_line_path, query_param=query_param)
+    baseline_id = next((baseline["Id"] for baseline in resp_val["value"] if baseline["Name"] == baseline_name), None)
+    if baseline_id is None:
+        module.exit_json(msg="Specified baseline_name does not exist in the system.", baseline_compliance_info=[])
+    return baseline_id
 
 
 def get_baselines_report_by_device_ids(rest_obj, module):
@@ -354,22 +372,22 @@ def get_baselines_report_by_device_ids(rest_obj, module):
         err_list = err_message.get('error', {}).get('@Message.ExtendedInfo', [{"Message": EXIT_MESSAGE}])
         if err_list:
             err_reason = err_list[0].get("Message", EXIT_MESSAGE)
-            if MSG_ID in err_list[0].get('MessageId'):
+            if MSG_ID in err_list[0].get('MessageId', ''):
                 module.exit_json(msg=err_reason)
-        raise err
-    except (URLError, SSLValidationError, ConnectionError, TypeError, ValueError) as err:
-        raise err
+        module.fail_json(msg=str(err), error_info=err_message)
 
 
 def get_baseline_compliance_reports(rest_obj, module):
-    try:
-        baseline_id = get_baseline_id_from_name(rest_obj, module)
-        path = baselines_compliance_report_path.format(Id=baseline_id)
-        resp_val = rest_obj.get_all_items_with_pagination(path)
-        resp_data = resp_val["value"]
-        return resp_data
-    except (URLError, HTTPError, SSLValidationError, ConnectionError, TypeError, ValueError) as err:
-        raise err
+    baseline_id = get_baseline_id_from_name(rest_obj, module)
+    path = baselines_compliance_report_path.format(Id=baseline_id)
+    components = module.params.get("components", True)
+    query_param = None if components else {"$select": COMPLIANCE_SUMMARY_FIELDS}
+    resp_val = rest_obj.get_all_items_with_pagination(path, query_param=query_param)
+    resp_data = resp_val["value"]
+    if not components:
+        for report in resp_data:
+            report.pop("ComponentComplianceReports", None)
+    return resp_data
 
 
 def validate_inputs(module):
@@ -378,7 +396,7 @@ def validate_inputs(module):
     device_group_names = module_params.get("device_group_names")
     device_ids = module_params.get("device_ids")
     baseline_name = module_params.get("baseline_name")
-    if all(not identifer for identifer in [device_ids, device_service_tags, device_group_names, baseline_name]):
+    if not any((device_ids, device_service_tags, device_group_names, baseline_name)):
         module.fail_json(msg="one of the following is required: device_ids, device_service_tags, "
                              "device_group_names, baseline_name to generate device based compliance report.")
 
@@ -389,6 +407,7 @@ def main():
         "device_service_tags": {"required": False, "type": "list", "elements": 'str'},
         "device_ids": {"required": False, "type": "list", "elements": 'int'},
         "device_group_names": {"required": False, "type": "list", "elements": 'str'},
+        "components": {"type": "bool", "default": True},
     }
 
     module = OmeAnsibleModule(
@@ -17,7 +17,8 @@ __metaclass__ = type
 import pytest
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
-from ansible_collections.dellemc.openmanage.plugins.module_utils.redfish import Redfish, OpenURLResponse
+from ansible_collections.dellemc.openmanage.plugins.module_utils.redfish import Redfish, OpenURLResponse, \
+    RedfishAnsibleModule, AnsibleModule
 from mock import MagicMock
 import json
 
@@ -169,3 +170,26 @@ class TestRedfishRest(object):
         ourl = OpenURLResponse(obj)
         reason_ret = ourl.reason
         assert reason_ret == "returning reason"
+
+
+class TestRedfishAnsibleModule(object):
+
+    def test_redfish_ansible_module_does_not_mutate_inputs(self, mocker):
+        init_mock = mocker.patch.object(AnsibleModule, '__init__', return_value=None)
+        argument_spec = {"command": {"type": "str"}, "target": {"type": "list"}}
+        mutually_exclusive = [("command", "target")]
+        required_together = [("command", "target")]
+        required_one_of = [("command", "target")]
+        for _ in range(2):
+            RedfishAnsibleModule(argument_spec=argument_spec, mutually_exclusive=mutually_exclusive,
+                                 required_together=required_together, required_one_of=required_one_of)
+        assert argument_spec == {"command": {"type": "str"}, "target": {"type": "list"}}
+        assert mutually_exclusive == [("command", "target")]
+        assert required_together == [("command", "target")]
+        assert required_one_of == [("command", "target")]
+        assert init_mock.call_count == 2
+        args = init_mock.call_args[0]
+        assert "baseuri" in args[0] and "command" in args[0]
+        assert args[3] == [("command", "target"), ("username", "x_auth_token"), ("password", "x_auth_token")]
+        assert args[4] == [("command", "target"), ("username", "password")]
+        assert args[5] == [("command", "target"), ("username", "x_auth_token")]
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+from mock import MagicMock
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import wait_for_job_completion
+
+MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
+JOB_URI = "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/JID_XXXXXXXXXXXXX"
+
+
+class TestWaitForJobCompletion(object):
+
+    @pytest.fixture
+    def sleep_mock(self, mocker):
+        return mocker.patch(MODULE_UTIL_PATH + 'utils.time.sleep')
+
+    @staticmethod
+    def get_redfish_obj(job_data):
+        redfish_obj = MagicMock()
+        redfish_obj.invoke_request.return_value.json_data = job_data
+        return redfish_obj
+
+    def test_wait_for_job_completion_failed_job(self, sleep_mock):
+        redfish_obj = self.get_redfish_obj({"JobState": "Failed", "PercentComplete": 20})
+        job_resp, msg = wait_for_job_completion(redfish_obj, JOB_URI)
+        assert msg == ""
+        assert job_resp.json_data["JobState"] == "Failed"
+        redfish_obj.invoke_request.assert_called_once_with("GET", JOB_URI)
+
+    def test_wait_for_job_completion_completed_job(self, sleep_mock):
+        redfish_obj = self.get_redfish_obj({"JobState": "Completed", "PercentComplete": 100})
+        job_resp, msg = wait_for_job_completion(redfish_obj, JOB_URI)
+        assert msg == ""
+        assert job_resp.json_data["PercentComplete"] == 100
+        redfish_obj.invoke_request.assert_called_once_with("GET", JOB_URI)
+
+    def test_wait_for_job_completion_timeout(self, sleep_mock):
+        redfish_obj = self.get_redfish_obj({"JobState": "Running", "PercentComplete": 50})
+        job_resp, msg = wait_for_job_completion(redfish_obj, JOB_URI, wait_timeout=30)
+        assert job_resp == {}
+        assert msg == "The job is not complete after 30 seconds."
+
+    def test_wait_for_job_completion_backoff(self, sleep_mock):
+        redfish_obj = self.get_redfish_obj({"JobState": "Running", "PercentComplete": 50})
+        wait_for_job_completion(redfish_obj, JOB_URI, wait_timeout=120)
+        sleep_intervals = [each.args[0] for each in sleep_mock.call_args_list]
+        expected = [1, 1.5, 2.25, 3.375, 5.0625, 7.59375, 11.390625, 17.0859375, 25.62890625, 30]
+        assert sleep_intervals[:-1] == pytest.approx(expected)
+        assert sum(sleep_intervals) == pytest.approx(120)
+        assert redfish_obj.invoke_request.call_count == 11
+        assert redfish_obj.invoke_request.call_count < 12
@@ -47,9 +47,10 @@ class TestIdracRedfishStorageController(FakeAnsibleModule):
         f_module = self.get_module_mock(params=param)
         redfish_response_mock.success = True
         redfish_response_mock.status_code = 200
+        redfish_response_mock.json_data = {"Id": RAID_INTEGRATED_1_1}
         result = self.module.check_id_exists(f_module, redfish_str_controller_conn, "controller_id",
                                              RAID_INTEGRATED_1_1, uri)
-        assert result is None
+        assert result == {"Id": RAID_INTEGRATED_1_1}
 
         redfish_response_mock.success = False
         redfish_response_mock.status_code = 400
@@ -170,8 +171,9 @@ class TestIdracRedfishStorageController(FakeAnsibleModule):
         param = {"baseuri": "XX.XX.XX.XX", "username": "username", "password": "password",
                  "controller_id": "RAID.Mezzanine.1C-1", "command": "ResetConfig"}
         f_module = self.get_module_mock(params=param)
-        mocker.patch(MODULE_PATH + "idrac_redfish_storage_controller.check_id_exists", return_value=None)
-        redfish_str_controller_conn.json_data = {"Members": ["virtual_drive"]}
+        mocker.patch(MODULE_PATH + "idrac_redfish_storage_controller.check_id_exists",
+                     side_effect=lambda *args: redfish_response_mock.json_data)
+        redfish_response_mock.json_data = {"Members": ["virtual_drive"]}
         redfish_response_mock.headers = {"Location": "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/JID_XXXXXXXXXXXXX"}
         result = self.module.ctrl_reset_config(f_module, redfish_str_controller_conn)
         assert result[2] == "JID_XXXXXXXXXXXXX"
@@ -208,6 +210,17 @@ class TestIdracRedfishStorageController(FakeAnsibleModule):
             self.module.hot_spare_config(f_module, redfish_str_controller_conn)
         assert ex.value.args[0] == "No changes found to be applied."
 
+        param.update({"command": "UnassignSpare"})
+        with pytest.raises(Exception) as ex:
+            self.module.hot_spare_config(f_module, redfish_str_controller_conn)
+        assert ex.value.args[0] == "Changes found to be applied."
+
+        redfish_response_mock.json_data = {"HotspareType": "None"}
+        f_module.check_mode = False
+        with pytest.raises(Exception) as ex:
+            self.module.hot_spare_config(f_module, redfish_str_controller_conn)
+        assert ex.value.args[0] == "No changes found to be applied."
+
         json_str = to_text(json.dumps({"data": "out"}))
         redfish_str_controller_conn.invoke_request.side_effect = HTTPError(
             HTTPS_ADDRESS, 400,
@@ -221,7 +234,8 @@ class TestIdracRedfishStorageController(FakeAnsibleModule):
     def test_ctrl_key(self, redfish_str_controller_conn, redfish_response_mock, mocker):
         param = {"baseuri": "XX.XX.XX.XX", "username": "username", "password": "password",
                  "command": "SetControllerKey", "controller_id": RAID_INTEGRATED_1_1, "mode": "LKM"}
-        mocker.patch(MODULE_PATH + "idrac_redfish_storage_controller.check_id_exists", return_value=None)
+        mocker.patch(MODULE_PATH + "idrac_redfish_storage_controller.check_id_exists",
+                     side_effect=lambda *args: redfish_response_mock.json_data)
         f_module = self.get_module_mock(params=param)
         redfish_response_mock.json_data = {"SecurityStatus": "EncryptionNotCapable", "KeyID": None}
         with pytest.raises(Exception) as ex:
@@ -300,15 +314,50 @@ class TestIdracRedfishStorageController(FakeAnsibleModule):
         result = self.module.ctrl_key(f_module, redfish_str_controller_conn)
         assert result[2] == "JID_XXXXXXXXXXXXX"
 
+    def test_ctrl_key_rekey_check_mode(self, redfish_str_controller_conn, mocker):
+        param = {"baseuri": "XX.XX.XX.XX", "username": "username", "password": "password",
+                 "command": "ReKey", "controller_id": RAID_INTEGRATED_1_1, "mode": "LKM"}
+        check_id_mock = mocker.patch(MODULE_PATH + "idrac_redfish_storage_controller.check_id_exists")
+        f_module = self.get_module_mock(params=param, check_mode=True)
+        with pytest.raises(Exception) as ex:
+            self.module.ctrl_key(f_module, redfish_str_controller_conn)
+        assert ex.value.args[0] == "Changes found to be applied."
+        check_id_mock.assert_not_called()
+        redfish_str_controller_conn.invoke_request.assert_not_called()
+
+    @pytest.mark.parametrize("condition, job_wait", [(False, True), (True, False)])
+    def test_job_condition_check_submission(self, redfish_str_controller_conn, redfish_response_mock,
+                                            mocker, condition, job_wait):
+        param = {"baseuri": "XX.XX.XX.XX", "username": "username", "password": "password",
+                 "job_wait": job_wait, "job_wait_timeout": 120}
+        job_uri = "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/JID_XXXXXXXXXXXXX"
+        wait_mock = mocker.patch(MODULE_PATH + "idrac_redfish_storage_controller.wait_for_job_completion")
+        redfish_response_mock.json_data = {"JobState": "Scheduled", "PercentComplete": 0}
+        f_module = self.get_module_mock(params=param)
+        with pytest.raises(Exception) as ex:
+            self.module.job_condition_check(f_module, redfish_str_controller_conn, "JID_XXXXXXXXXXXXX", job_uri,
+                                            "completed", "submitted", condition=condition)
+        assert ex.value.args[0] == "submitted"
+        assert ex.value.fail_kwargs["status"]["JobState"] == "Scheduled"
+        wait_mock.assert_not_called()
+        redfish_str_controller_conn.invoke_request.assert_called_once_with("GET", job_uri)
+
     def test_convert_raid_status(self, redfish_str_controller_conn, redfish_response_mock):
         param = {"baseuri": "XX.XX.XX.XX", "username": "username", "password": "password",
                  "command": "ConvertToRAID", "target": ["Disk.Bay.0:Enclosure.Internal.0-1:RAID.Slot.1-1",
                                                         "Disk.Bay.1:Enclosure.Internal.0-1:RAID.Slot.1-1"]}
         f_module = self.get_module_mock(params=param)
-        redfish_response_mock.json_data = {"Oem": {"Dell": {"DellPhysicalDisk": {"RaidStatus": "NonRAID"}}}}
+        drives_uri = "/redfish/v1/Systems/System.Embedded.1/Storage/RAID.Slot.1-1/Drives/"
+
+        def storage_data(raid_status):
+            oem = {"Dell": {"DellPhysicalDisk": {"RaidStatus": raid_status}}}
+            return {"Drives": [{ODATA_ID: drives_uri + drive, "Oem": oem} for drive in param["target"]]}
+
+        redfish_response_mock.json_data = storage_data("NonRAID")
         redfish_response_mock.headers = {"Location": "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/JID_XXXXXXXXXXXXX"}
         result = self.module.convert_raid_status(f_module, redfish_str_controller_conn)
         assert result[2] == "JID_XXXXXXXXXXXXX"
+        assert redfish_str_controller_conn.invoke_request.call_count == 2
 
         f_module.check_mode = True
         with pytest.raises(Exception) as ex:
@@ -316,11 +365,23 @@ class TestIdracRedfishStorageController(FakeAnsibleModule):
         assert ex.value.args[0] == "Changes found to be applied."
 
         f_module.check_mode = False
-        redfish_response_mock.json_data = {"Oem": {"Dell": {"DellPhysicalDisk": {"RaidStatus": "Ready"}}}}
+        redfish_response_mock.json_data = storage_data("Ready")
         with pytest.raises(Exception) as ex:
             self.module.convert_raid_status(f_module, redfish_str_controller_conn)
         assert ex.value.args[0] == "No changes found to be applied."
 
+        # Drives not expanded by the iDRAC are read one at a time
+        redfish_response_mock.json_data = {"Drives": [{ODATA_ID: drives_uri + drive} for drive in param["target"]],
+                                           "Oem": {"Dell": {"DellPhysicalDisk": {"RaidStatus": "Ready"}}}}
+        with pytest.raises(Exception) as ex:
+            self.module.convert_raid_status(f_module, redfish_str_controller_conn)
+        assert ex.value.args[0] == "No changes found to be applied."
+
+        redfish_response_mock.json_data = {"Drives": []}
+        with pytest.raises(Exception) as ex:
+            self.module.convert_raid_status(f_module, redfish_str_controller_conn)
+        assert ex.value.args[0] == "Unable to locate the physical disk with the ID: Disk.Bay.0:Enclosure.Internal.0-1:RAID.Slot.1-1"
+
         json_str = to_text(json.dumps({"data": "out"}))
         redfish_str_controller_conn.invoke_request.side_effect = HTTPError(
             HTTPS_ADDRESS, 400,
@@ -331,6 +392,31 @@ class TestIdracRedfishStorageController(FakeAnsibleModule):
             self.module.convert_raid_status(f_module, redfish_str_controller_conn)
         assert ex.value.args[0] == "Unable to locate the physical disk with the ID: Disk.Bay.0:Enclosure.Internal.0-1:RAID.Slot.1-1"
 
+    def test_get_controller_drives(self, redfish_str_controller_conn, redfish_response_mock):
+        drive_uri = "/redfish/v1/Systems/System.Embedded.1/Storage/RAID.Slot.1-1/Drives/" \
+                    "Disk.Bay.0:Enclosure.Internal.0-1:RAID.Slot.1-1"
+        redfish_response_mock.json_data = {"Drives": [{ODATA_ID: drive_uri}]}
+        result = self.module.get_controller_drives(redfish_str_controller_conn, "RAID.Slot.1-1")
+        assert result == {"Disk.Bay.0:Enclosure.Internal.0-1:RAID.Slot.1-1": {ODATA_ID: drive_uri}}
+        redfish_str_controller_conn.invoke_request.assert_called_with(
+            "GET", "/redfish/v1/Systems/System.Embedded.1/Storage/RAID.Slot.1-1?$expand=.($levels=1)")
+
+        redfish_response_mock.json_data = {}
+        result = self.module.get_controller_drives(redfish_str_controller_conn, "RAID.Slot.1-1")
+        assert result == {}
+
+    def test_get_controller_id(self):
+        assert self.module.get_controller_id("Disk.Bay.0:Enclosure.Internal.0-1:RAID.Slot.1-1") == "RAID.Slot.1-1"
+        assert self.module.get_controller_id("RAID.Slot.1-1") == "RAID.Slot.1-1"
+
+    def test_match_id_in_list(self):
+        storage_uri = "/redfish/v1/Systems/System.Embedded.1/Storage/"
+        member_list = [{ODATA_ID: storage_uri + "RAID.Integrated.1-1"}, {ODATA_ID: storage_uri + "RAID.Slot.1-1"}]
+        assert self.module.match_id_in_list("RAID.Slot.1-1", member_list) == storage_uri + "RAID.Slot.1-1"
+        assert self.module.match_id_in_list("RAID.Slot.1", member_list) is None
+        assert self.module.get_member_by_id("RAID.Slot.1-1", member_list) is member_list[1]
+        assert self.module.get_member_by_id("RAID.Slot.1", member_list) is None
+
     def test_change_pd_status(self, redfish_str_controller_conn, redfish_response_mock):
         param = {"baseuri": "XX.XX.XX.XX", "username": "username", "password": "password",
                  "command": "ChangePDStateToOnline",
@@ -400,6 +486,19 @@ class TestIdracRedfishStorageController(FakeAnsibleModule):
             self.module.lock_virtual_disk(f_module, redfish_str_controller_conn)
         assert ex.value.args[0] == "Volume is not encryption capable."
 
+        redfish_response_mock.json_data = {"Oem": {"Dell": {"DellVolume": {"LockStatus": "Unlocked"}}},
+                                           "Links": {
+                                               "Drives": [
+                                                   {
+                                                       ODATA_ID: "/redfish/v1/Systems/System.Embedded.1/",
+                                                       "EncryptionAbility": "SelfEncryptingDrive"
+                                                   }],
+                                               "Drives@odata.count": 1}}
+        redfish_str_controller_conn.invoke_request.reset_mock()
+        result = self.module.lock_virtual_disk(f_module, redfish_str_controller_conn)
+        assert result[2] == "JID_XXXXXXXXXXXXX"
+        assert redfish_str_controller_conn.invoke_request.call_count == 2
+
         json_str = to_text(json.dumps({"data": "out"}))
         redfish_str_controller_conn.invoke_request.side_effect = HTTPError(
             HTTPS_ADDRESS, 400,
@@ -852,8 +951,6 @@ class TestIdracRedfishStorageController(FakeAnsibleModule):
             elif args[2] == "Drives":
                 return [{odata: storage_uri + drive_uri},
                         {odata: storage_uri + "/RAID.Integrated.1-1/Drives/Disk.Bay.1:Enclosure.Internal.0-1:RAID.Integrated.1-1"}]
-            elif args[2] == "Actions":
-                return {"#Drive.SecureErase": {"target": drive_uri + "/Actions/Drive.SecureErase"}}
 
         def mock_get_dynamic_uri_request_1(*args, **kwargs):
             if len(args) > 2:
@@ -927,8 +1024,10 @@ class TestIdracRedfishStorageController(FakeAnsibleModule):
         def mock_get_dynamic_uri_request_3(*args, **kwargs):
             if len(args) > 2:
                 return common_data_in_mock_dynamic_request(args)
+            drive_uri = "/redfish/v1/Systems/System.Embedded.1/Storage/RAID.Integrated.1-1/Drives/" + drive_id_1
             return {"Oem": {"Dell": {"DellPhysicalDisk": {"RaidStatus": "Ready",
-                                                          "SystemEraseCapability": "CryptographicErasePD"}}}}
+                                                          "SystemEraseCapability": "CryptographicErasePD"}}},
+                    "Actions": {"#Drive.SecureErase": {"target": drive_uri + "/Actions/Drive.SecureErase"}}}
         redfish_default_args.update({"controller_id": RAID_INTEGRATED_1_1,
                                      "target": drive_id_1,
                                      "job_wait": False})
@@ -937,6 +1036,19 @@ class TestIdracRedfishStorageController(FakeAnsibleModule):
         result = self._run_module(redfish_default_args)
         assert result["msg"] == "Successfully submitted the job that performs the 'SecureErase' operation."
 
+        # Scenario 7A: When the storage members are expanded, the controller drives are not fetched again
+        def mock_get_dynamic_uri_request_4(*args, **kwargs):
+            if len(args) > 2 and args[2] == "Members":
+                storage_uri = "/redfish/v1/Systems/System.Embedded.1/Storage/RAID.Integrated.1-1"
+                return [{ODATA_ID: storage_uri, "Drives": [{ODATA_ID: storage_uri + "/Drives/" + drive_id_1}]}]
+            if len(args) > 2 and args[2] == "Drives":
+                raise AssertionError("controller drives fetched again")
+            return mock_get_dynamic_uri_request_3(*args, **kwargs)
+        mocker.patch(MODULE_PATH + module + "get_dynamic_uri",
+                     side_effect=mock_get_dynamic_uri_request_4)
+        result = self._run_module(redfish_default_args)
+        assert result["msg"] == "Successfully submitted the job that performs the 'SecureErase' operation."
+
         # Scenario 8: When drive is ready and support secure erase, job_wait is true
         redfish_default_args.update({"controller_id": RAID_INTEGRATED_1_1,
                                      "target": drive_id_1,
@@ -1107,6 +1219,11 @@ class TestIdracRedfishStorageController(FakeAnsibleModule):
                      return_value=redfish_response_mock)
         result = self._run_module(redfish_default_args)
         assert result["msg"] == "Successfully performed the 'BlinkTarget' operation."
+        redfish_str_controller_conn.invoke_request.reset_mock()
+        result = self._run_module(redfish_default_args, check_mode=True)
+        assert result["msg"] == "Changes found to be applied."
+        assert result["changed"] is True
+        redfish_str_controller_conn.invoke_request.assert_not_called()
         param.update({"command": "ConvertToRAID"})
         redfish_default_args.update(param)
         mocker.patch(MODULE_PATH + 'idrac_redfish_storage_controller.convert_raid_status',
@@ -15,6 +15,7 @@ __metaclass__ = type
 import pytest
 import json
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+from ansible.module_utils.six.moves.urllib.parse import quote
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from io import StringIO
 from ansible.module_utils._text import to_text
@@ -39,47 +40,61 @@ class TestOmeFirmwareCatalog(FakeAnsibleModule):
 
     def test__get_device_id_from_service_tags_for_baseline_success_case(self, ome_response_mock,
                                                                         ome_connection_mock_for_firmware_baseline_compliance_info):
-        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_report_details.return_value = {
-            "report_list": [{"DeviceServiceTag": Constants.service_tag1, "Id": Constants.device_id1}]}
-        f_module = self.get_module_mock()
+        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_items_with_pagination.return_value = {
+            "value": [{"DeviceServiceTag": Constants.service_tag1, "Id": Constants.device_id1}]}
         data = self.module._get_device_id_from_service_tags([Constants.service_tag1],
-                                                            ome_connection_mock_for_firmware_baseline_compliance_info,
-                                                            f_module)
+                                                            ome_connection_mock_for_firmware_baseline_compliance_info)
         assert data == {Constants.device_id1: Constants.service_tag1}
+        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_items_with_pagination.assert_called_once_with(
+            "DeviceService/Devices", query_param={"$filter": "DeviceServiceTag eq '{0}'".format(Constants.service_tag1)})
+
+    def test__get_device_id_from_service_tags_case_insensitive(self, ome_response_mock,
+                                                               ome_connection_mock_for_firmware_baseline_compliance_info):
+        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_items_with_pagination.return_value = {
+            "value": [{"DeviceServiceTag": Constants.service_tag1, "Id": Constants.device_id1},
+                      {"DeviceServiceTag": Constants.service_tag2.lower(), "Id": Constants.device_id2},
+                      {"DeviceServiceTag": None, "Id": 789}]}
+        data = self.module._get_device_id_from_service_tags(
+            [Constants.service_tag1.lower(), Constants.service_tag1, Constants.service_tag2],
+            ome_connection_mock_for_firmware_baseline_compliance_info)
+        assert data == {Constants.device_id1: Constants.service_tag1, Constants.device_id2: Constants.service_tag2.lower()}
+        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_items_with_pagination.assert_called_once_with(
+            "DeviceService/Devices", query_param={"$filter": "DeviceServiceTag eq '{0}' or DeviceServiceTag eq '{1}'".format(
+                Constants.service_tag1, Constants.service_tag2)})
 
     def test__get_device_id_from_service_tags_empty_case(self, ome_response_mock,
                                                          ome_connection_mock_for_firmware_baseline_compliance_info):
-        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_report_details.return_value = {
-            "report_list": []}
-        f_module = self.get_module_mock()
-        with pytest.raises(Exception) as exc:
-            data = self.module._get_device_id_from_service_tags([Constants.service_tag1],
-                                                                ome_connection_mock_for_firmware_baseline_compliance_info,
-                                                                f_module)
-        assert exc.value.args[0] == "Unable to fetch the device information."
+        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_items_with_pagination.return_value = {
+            "value": []}
+        data = self.module._get_device_id_from_service_tags([Constants.service_tag1],
+                                                            ome_connection_mock_for_firmware_baseline_compliance_info)
+        assert data == {}
+
+    def test__get_device_id_from_service_tags_chunked(self, ome_response_mock,
+                                                      ome_connection_mock_for_firmware_baseline_compliance_info):
+        tags = ["TAG{0:04d}".format(index) for index in range(500)]
+        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_items_with_pagination.side_effect = \
+            lambda path, query_param: {"value": [{"DeviceServiceTag": tag, "Id": index} for index, tag in enumerate(tags)
+                                                 if "'{0}'".format(tag) in query_param["$filter"]]}
+        data = self.module._get_device_id_from_service_tags(tags, ome_connection_mock_for_firmware_baseline_compliance_info)
+        assert data == dict(enumerate(tags))
+        calls = ome_connection_mock_for_firmware_baseline_compliance_info.get_all_items_with_pagination.call_args_list
+        assert len(calls) > 1
+        for each in calls:
+            assert len(quote(each.kwargs["query_param"]["$filter"])) <= self.module.SERVICE_TAG_FILTER_MAX_LENGTH
+
+    def test__get_service_tag_filters_escapes_quote(self):
+        assert self.module._get_service_tag_filters(["AB'C", "XYZ"]) == [
+            "DeviceServiceTag eq 'AB''C' or DeviceServiceTag eq 'XYZ'"]
 
     def test_get_device_id_from_service_tags_for_baseline_error_case(self,
                                                                      ome_connection_mock_for_firmware_baseline_compliance_info,
                                                                      ome_response_mock):
-        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_report_details.side_effect = HTTPError(
+        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_items_with_pagination.side_effect = HTTPError(
             HTTP_ADDRESS, 400, '', {}, None)
-        f_module = self.get_module_mock()
         with pytest.raises(HTTPError) as ex:
             self.module._get_device_id_from_service_tags(["INVALID"],
-                                                         ome_connection_mock_for_firmware_baseline_compliance_info,
-                                                         f_module)
-
-    def test_get_device_id_from_service_tags_for_baseline_value_error_case(self,
-                                                                           ome_connection_mock_for_firmware_baseline_compliance_info,
-                                                                           ome_response_mock):
-        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_report_details.return_value = {
-            "report_list": []}
-        f_module = self.get_module_mock()
-        with pytest.raises(Exception) as exc:
-            self.module._get_device_id_from_service_tags(["#$%^&"],
-                                                         ome_connection_mock_for_firmware_baseline_compliance_info,
-                                                         f_module)
-        assert exc.value.args[0] == "Unable to fetch the device information."
+                                                         ome_connection_mock_for_firmware_baseline_compliance_info)
 
     def test_get_device_ids_from_group_ids_success_case(self, ome_response_mock,
                                                         ome_connection_mock_for_firmware_baseline_compliance_info):
@@ -88,7 +103,24 @@ class TestOmeFirmwareCatalog(FakeAnsibleModule):
         f_module = self.get_module_mock()
         device_ids = self.module.get_device_ids_from_group_ids(f_module, ["123", "345"],
                                                                ome_connection_mock_for_firmware_baseline_compliance_info)
-        assert device_ids == [Constants.device_id1, Constants.device_id1]
+        assert device_ids == [Constants.device_id1]
+        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_items_with_pagination.side_effect = [
+            {"value": [{"Id": Constants.device_id2}, {"Id": Constants.device_id1}]},
+            {"value": [{"Id": Constants.device_id1}]}]
+        device_ids = self.module.get_device_ids_from_group_ids(f_module, ["123", "345"],
+                                                               ome_connection_mock_for_firmware_baseline_compliance_info)
+        assert device_ids == [Constants.device_id2, Constants.device_id1]
+
+    def test_get_device_ids_from_group_ids_duplicate_group_case(self, ome_response_mock,
+                                                                ome_connection_mock_for_firmware_baseline_compliance_info):
+        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_items_with_pagination.return_value = {
+            "value": [{"DeviceServiceTag": Constants.service_tag1, "Id": Constants.device_id1}]}
+        f_module = self.get_module_mock()
+        device_ids = self.module.get_device_ids_from_group_ids(f_module, ["123", "123"],
+                                                               ome_connection_mock_for_firmware_baseline_compliance_info)
+        assert device_ids == [Constants.device_id1]
+        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_items_with_pagination.assert_called_once_with(
+            "GroupService/Groups(123)/Devices")
 
     def test_get_device_ids_from_group_ids_empty_case(self, ome_response_mock,
                                                       ome_connection_mock_for_firmware_baseline_compliance_info):
@@ -123,13 +155,14 @@ class TestOmeFirmwareCatalog(FakeAnsibleModule):
                                                           ome_connection_mock_for_firmware_baseline_compliance_info):
         ome_connection_mock_for_firmware_baseline_compliance_info.get_all_report_details.return_value = {
             "report_list": [{"Name": "group1", "Id": 123}]}
-        mocker.patch(
+        group_ids_mock = mocker.patch(
             'ansible_collections.dellemc.openmanage.plugins.modules.ome_firmware_baseline_compliance_info.get_device_ids_from_group_ids',
             return_value=[Constants.device_id1, Constants.device_id2])
         f_module = self.get_module_mock(params={"device_group_names": ["group1", "group2"]})
         device_ids = self.module.get_device_ids_from_group_names(f_module,
                                                                  ome_connection_mock_for_firmware_baseline_compliance_info)
         assert device_ids == [Constants.device_id1, Constants.device_id2]
+        assert group_ids_mock.call_args[0][1] == [123]
 
     def test_get_device_ids_from_group_names_empty_case(self, mocker, ome_response_mock,
                                                         ome_connection_mock_for_firmware_baseline_compliance_info):
@@ -220,6 +253,8 @@ class TestOmeFirmwareCatalog(FakeAnsibleModule):
         baseline_id = self.module.get_baseline_id_from_name(ome_connection_mock_for_firmware_baseline_compliance_info,
                                                             f_module)
         assert baseline_id == 111
+        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_items_with_pagination.assert_called_once_with(
+            "UpdateService/Baselines", query_param={"$filter": "Name eq 'baseline_name1'"})
 
     def test_get_baseline_id_from_name_when_name_not_exists(self, default_ome_args,
                                                             ome_connection_mock_for_firmware_baseline_compliance_info,
@@ -239,7 +274,7 @@ class TestOmeFirmwareCatalog(FakeAnsibleModule):
         f_module = self.get_module_mock(params={"baseline_name": "baseline_name1"})
         with pytest.raises(AnsibleFailJSonException) as exc:
             self.module.get_baseline_id_from_name(ome_connection_mock_for_firmware_baseline_compliance_info, f_module)
-        assert exc.value.args[0] == "No baseline exists in the system."
+        assert exc.value.args[0] == "Specified baseline_name does not exist in the system."
 
     def test_get_baseline_id_from_name_when_baselinename_is_none(self, default_ome_args,
                                                                  ome_connection_mock_for_firmware_baseline_compliance_info,
@@ -357,6 +392,25 @@ class TestOmeFirmwareCatalog(FakeAnsibleModule):
                 ome_connection_mock_for_firmware_baseline_compliance_info,
                 f_module)
 
+    @pytest.mark.parametrize("message_id, error_msg", [("CUPD3090", "error message"),
+                                                       ("CGEN1004", "HTTP Error 400: http error message")])
+    def test_get_baselines_report_by_device_ids_http_error_case(self, mocker, message_id, error_msg,
+                                                                ome_connection_mock_for_firmware_baseline_compliance_info):
+        err_dict = {"error": {"@Message.ExtendedInfo": [{"MessageId": message_id, "Message": "error message"}]}}
+        mocker.patch(
+            'ansible_collections.dellemc.openmanage.plugins.modules.ome_firmware_baseline_compliance_info.get_identifiers',
+            return_value=([Constants.device_id1], "device_ids"))
+        ome_connection_mock_for_firmware_baseline_compliance_info.invoke_request.side_effect = HTTPError(
+            HTTP_ADDRESS, 400, 'http error message', {"accept-type": "application/json"},
+            StringIO(to_text(json.dumps(err_dict))))
+        f_module = self.get_module_mock()
+        with pytest.raises(AnsibleFailJSonException) as exc:
+            self.module.get_baselines_report_by_device_ids(ome_connection_mock_for_firmware_baseline_compliance_info,
+                                                           f_module)
+        assert exc.value.args[0] == error_msg
+        if message_id != "CUPD3090":
+            assert exc.value.fail_kwargs["error_info"] == err_dict
+
     def test_get_baseline_compliance_reports_success_case_for_baseline_device(self, mocker, ome_response_mock,
                                                                               ome_connection_mock_for_firmware_baseline_compliance_info):
         mocker.patch(
@@ -369,6 +423,21 @@ class TestOmeFirmwareCatalog(FakeAnsibleModule):
                                                            f_module)
         assert data == [{"baseline_device_report1": "data"}]
 
+    def test_get_baseline_compliance_reports_without_components(self, mocker, ome_response_mock,
+                                                                ome_connection_mock_for_firmware_baseline_compliance_info):
+        mocker.patch(
+            'ansible_collections.dellemc.openmanage.plugins.modules.ome_firmware_baseline_compliance_info.get_baseline_id_from_name',
+            return_value=123)
+        f_module = self.get_module_mock(params={"baseline_name": "baseline1", "components": False})
+        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_items_with_pagination.return_value = {
+            "value": [{"DeviceId": Constants.device_id1, "ComponentComplianceReports": []}]}
+        data = self.module.get_baseline_compliance_reports(ome_connection_mock_for_firmware_baseline_compliance_info,
+                                                           f_module)
+        assert data == [{"DeviceId": Constants.device_id1}]
+        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_items_with_pagination.assert_called_once_with(
+            "UpdateService/Baselines(123)/DeviceComplianceReports",
+            query_param={"$select": self.module.COMPLIANCE_SUMMARY_FIELDS})
+
     @pytest.mark.parametrize("exc_type",
                              [URLError, HTTPError, SSLValidationError, ConnectionError, TypeError, ValueError])
     def test_get_baseline_compliance_reports_exception_handling_case(self, exc_type, mocker, ome_response_mock,